@@ -0,0 +1,169 @@
+"""
+Pruebas del analizador léxico, el parser y el evaluador.
+
+Los casos fijan el comportamiento del programa original para que los cambios
+en Lexer, Parser.parse_expr o compile_ast puedan comprobarse contra él.
+Se ejecutan con: python -m unittest
+"""
+import unittest
+
+from asociatividad import (
+    Interpreter,
+    Lexer,
+    OpCode,
+    Parser,
+    compile_ast,
+    parse_cached,
+)
+
+
+def parse(text):
+    return Parser(Lexer(text)).parse()
+
+
+class EvaluationMixin:
+    def evaluate(self, text, interpreter=None):
+        """Evalúa por los dos caminos (interpret y run) y exige que coincidan"""
+        interpreter = interpreter or Interpreter()
+        direct = Interpreter()
+        direct.variables = dict(interpreter.variables)
+        expected = direct.interpret(parse(text))
+        result = interpreter.run(parse_cached(text)[1])
+        self.assertEqual(result, expected)
+        self.assertEqual(type(result), type(expected))
+        self.assertEqual(interpreter.variables, direct.variables)
+        return result
+
+
+class AssociativityTest(EvaluationMixin, unittest.TestCase):
+    def test_left_associative_operators(self):
+        cases = {
+            "5 - 3 - 2": (0, "BinaryOp(BinaryOp(Num(5), -, Num(3)), -, Num(2))"),
+            "8 / 4 / 2": (1.0, "BinaryOp(BinaryOp(Num(8), /, Num(4)), /, Num(2))"),
+            "2 * 3 * 4": (24, "BinaryOp(BinaryOp(Num(2), *, Num(3)), *, Num(4))"),
+            "10 + 5 + 3": (18, "BinaryOp(BinaryOp(Num(10), +, Num(5)), +, Num(3))"),
+        }
+        for text, (value, tree) in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.evaluate(text), value)
+                self.assertEqual(repr(parse(text)), tree)
+
+    def test_power_is_right_associative(self):
+        self.assertEqual(self.evaluate("2 ** 3 ** 2"), 512)
+        self.assertEqual(
+            repr(parse("2 ** 3 ** 2")),
+            "BinaryOp(Num(2), **, BinaryOp(Num(3), **, Num(2)))")
+
+    def test_mixed_precedence(self):
+        self.assertEqual(self.evaluate("1 + 2 * 3 ** 2 - 4"), 15)
+        self.assertEqual(self.evaluate("2 ** 3 * 4 + 5"), 37)
+        self.assertEqual(self.evaluate("(1 + 2) * 3"), 9)
+
+    def test_unary_minus_binds_tighter_than_power(self):
+        # El factor unario se analiza antes que **: (-2) ** 2
+        self.assertEqual(self.evaluate("-2 ** 2"), 4)
+        self.assertEqual(
+            repr(parse("-2 ** 2")),
+            "BinaryOp(UnaryOp(-, Num(2)), **, Num(2))")
+
+
+class AssignmentTest(EvaluationMixin, unittest.TestCase):
+    def test_assignment_chain_is_right_associative(self):
+        interpreter = Interpreter()
+        self.assertEqual(self.evaluate("c = b = a = 15", interpreter), 15)
+        self.assertEqual(interpreter.variables, {'a': 15, 'b': 15, 'c': 15})
+        self.assertEqual(
+            repr(parse("c = b = a = 15")),
+            "Assign(Var(c), Assign(Var(b), Assign(Var(a), Num(15))))")
+
+    def test_variables_are_read_back(self):
+        interpreter = Interpreter()
+        self.evaluate("a = 3", interpreter)
+        self.assertEqual(self.evaluate("a * 2 - a", interpreter), 3)
+
+    def test_replaced_variables_dict_is_used(self):
+        interpreter = Interpreter()
+        interpreter.variables = {'a': 1}
+        self.assertEqual(self.evaluate("b = a + 1", interpreter), 2)
+        self.assertEqual(interpreter.variables, {'a': 1, 'b': 2})
+
+    def test_assignment_inside_parentheses_is_rejected(self):
+        with self.assertRaisesRegex(Exception, "Token inesperado"):
+            parse("(a = 5)")
+
+    def test_undefined_variable(self):
+        with self.assertRaisesRegex(NameError, "Variable 'x' no definida"):
+            Interpreter().run(parse_cached("x + 1")[1])
+        with self.assertRaisesRegex(NameError, "Variable 'x' no definida"):
+            Interpreter().interpret(parse("x + 1"))
+
+
+class LexerErrorTest(unittest.TestCase):
+    def test_malformed_number(self):
+        with self.assertRaisesRegex(ValueError, "'1.2.3'"):
+            parse("1.2.3")
+        with self.assertRaisesRegex(ValueError, "'1.2.3'"):
+            parse("2 1.2.3")
+
+    def test_non_decimal_digits_are_read_as_numbers(self):
+        # El original usaba isdigit(), que acepta superíndices
+        with self.assertRaisesRegex(ValueError, "'1²'"):
+            parse("1²")
+        with self.assertRaisesRegex(ValueError, "'²'"):
+            parse("²")
+
+    def test_invalid_character(self):
+        with self.assertRaisesRegex(Exception, "Carácter inválido en posición 2"):
+            parse("2 $ 3")
+
+    def test_trailing_float_dot(self):
+        self.assertEqual(parse("1."), parse("1.0"))
+
+
+class DivisionByZeroTest(unittest.TestCase):
+    def test_division_by_zero_is_raised_at_run_time(self):
+        tree, code = parse_cached("1/0")
+        self.assertEqual(repr(tree), "BinaryOp(Num(1), /, Num(0))")
+        with self.assertRaises(ZeroDivisionError):
+            Interpreter().run(code)
+        with self.assertRaises(ZeroDivisionError):
+            Interpreter().interpret(tree)
+
+
+class ConstantFoldingTest(unittest.TestCase):
+    def test_constants_are_folded_when_compiling(self):
+        self.assertEqual(compile_ast(parse("1 + 2 * 3 ** 2 - 4")),
+                         [(OpCode.PUSH, 15)])
+        self.assertEqual(compile_ast(parse("-(2 + 3)")), [(OpCode.PUSH, -5)])
+
+    def test_parser_does_not_fold(self):
+        self.assertEqual(repr(parse("2 ** -1")),
+                         "BinaryOp(Num(2), **, UnaryOp(-, Num(1)))")
+        self.assertEqual(repr(parse_cached("1 + 2")[0]),
+                         "BinaryOp(Num(1), +, Num(2))")
+
+    def test_unfoldable_division_is_kept(self):
+        self.assertEqual(compile_ast(parse("1 / 0 + 2"))[-1][0], OpCode.BINOP)
+
+
+class DeepTreeTest(unittest.TestCase):
+    TERMS = 5000
+
+    def setUp(self):
+        self.text = " + ".join(["a"] * self.TERMS)
+
+    def test_long_chain_is_evaluated_without_recursion(self):
+        interpreter = Interpreter()
+        interpreter.variables['a'] = 1
+        tree, code = parse_cached(self.text)
+        self.assertEqual(interpreter.run(code), self.TERMS)
+        self.assertEqual(interpreter.interpret(tree), self.TERMS)
+
+    def test_long_chain_can_be_displayed(self):
+        text = repr(parse(self.text))
+        self.assertTrue(text.startswith("BinaryOp(" * 10))
+        self.assertEqual(text.count("Var(a)"), self.TERMS)
+
+
+if __name__ == "__main__":
+    unittest.main()